@@ -5,14 +5,14 @@ Simple GUI for USGS Table Extractor.
 import tkinter as tk
 from tkinter import filedialog, scrolledtext, messagebox
 from pathlib import Path
+import queue
 import sys
+import threading
 import traceback
 
 # Add parent directory to path so we can import from src
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.docx_extractor import DocxTableExtractor
-
 
 class ExtractorGUI:
     """Simple GUI for table extraction."""
@@ -111,21 +111,57 @@ class ExtractorGUI:
         self.extractor = None
         self.processing = False
         
+        # Worker threads never touch Tk widgets; they post here and the
+        # Tk thread drains the queue on a timer.
+        self._log_q = queue.Queue()
+        self._poll_log()
+        
         self.write_log("="*70)
         self.write_log("USGS Table Extractor - Ready")
         self.write_log("="*70)
         self.write_log("\nSelect a file or folder to begin processing.\n")
     
     def write_log(self, message):
-        """Write to log window."""
-        self.log.insert(tk.END, message + "\n")
-        self.log.see(tk.END)
-        self.root.update()
+        """Write to log window (safe to call from any thread)."""
+        self._log_q.put(("log", message))
     
     def update_status(self, message):
-        """Update status bar."""
-        self.status_bar.config(text=message)
-        self.root.update()
+        """Update status bar (safe to call from any thread)."""
+        self._log_q.put(("status", message))
+    
+    def run_on_ui(self, func, *args):
+        """Run func on the Tk thread once earlier messages are shown."""
+        self._log_q.put(("call", (func, args)))
+    
+    def _poll_log(self):
+        """Apply queued log/status messages, then reschedule."""
+        lines = []
+        try:
+            while True:
+                kind, payload = self._log_q.get_nowait()
+                if kind == "log":
+                    lines.append(payload + "\n")
+                    continue
+                if lines:
+                    self.log.insert(tk.END, "".join(lines))
+                    self.log.see(tk.END)
+                    lines = []
+                if kind == "status":
+                    self.status_bar.config(text=payload)
+                else:
+                    func, args = payload
+                    try:
+                        func(*args)
+                    except Exception:
+                        # Log it and keep polling; otherwise the log stops for good
+                        lines.append(traceback.format_exc())
+        except queue.Empty:
+            pass
+        finally:
+            if lines:
+                self.log.insert(tk.END, "".join(lines))
+                self.log.see(tk.END)
+            self.root.after(100, self._poll_log)
     
     def disable_buttons(self):
         """Disable buttons during processing."""
@@ -145,6 +181,9 @@ class ExtractorGUI:
             self.write_log("Initializing extractor...")
             self.update_status("Initializing...")
             try:
+                # Imported here so the window opens before pandas/python-docx load
+                from src.docx_extractor import DocxTableExtractor
+                
                 self.extractor = DocxTableExtractor(
                     clean_data=True,
                     auto_convert_pdf=True
@@ -182,8 +221,15 @@ class ExtractorGUI:
         self.write_log(f"Processing: {Path(file_path).name}")
         self.write_log("="*70)
         
+        threading.Thread(
+            target=self._process_file_worker,
+            args=(Path(file_path),),
+            daemon=True
+        ).start()
+    
+    def _process_file_worker(self, input_file):
+        """Process single file (worker thread)."""
         try:
-            input_file = Path(file_path)
             output_dir = input_file.parent / "output"
             output_dir.mkdir(exist_ok=True)
             output_file = output_dir / f"{input_file.stem}_output.xlsx"
@@ -199,7 +245,17 @@ class ExtractorGUI:
             self.write_log("="*70 + "\n")
             
             self.update_status("Ready")
+            self.run_on_ui(self._file_done, output_file, output_dir)
             
+        except Exception as e:
+            self.write_log(f"\n❌ ERROR: {str(e)}")
+            self.write_log(traceback.format_exc())
+            self.update_status("Error")
+            self.run_on_ui(self._failed, e)
+    
+    def _file_done(self, output_file, output_dir):
+        """Report single-file result (Tk thread)."""
+        try:
             result = messagebox.askyesno(
                 "Success", 
                 f"File processed!\n\nOutput: {output_file.name}\n\nOpen folder?",
@@ -209,13 +265,18 @@ class ExtractorGUI:
             if result:
                 import os
                 os.startfile(output_dir)
-            
         except Exception as e:
+            # e.g. os.startfile only exists on Windows
             self.write_log(f"\n❌ ERROR: {str(e)}")
             self.write_log(traceback.format_exc())
-            self.update_status("Error")
             messagebox.showerror("Error", f"Failed:\n\n{str(e)}")
-        
+        finally:
+            self.enable_buttons()
+    
+    def _failed(self, error):
+        """Report an unexpected failure (Tk thread)."""
+        try:
+            messagebox.showerror("Error", f"Failed:\n\n{str(error)}")
         finally:
             self.enable_buttons()
     
@@ -240,21 +301,31 @@ class ExtractorGUI:
         self.write_log(f"Batch Processing: {Path(folder_path).name}")
         self.write_log("="*70)
         
+        input_dir = Path(folder_path)
+        pdf_files = list(input_dir.glob("*.pdf"))
+        docx_files = list(input_dir.glob("*.docx"))
+        all_files = pdf_files + docx_files
+        
+        if not all_files:
+            self.write_log("\n⚠️ No PDF or Word files found")
+            messagebox.showwarning("No Files", "No files found in folder.")
+            self.enable_buttons()
+            return
+        
+        threading.Thread(
+            target=self._process_folder_worker,
+            args=(input_dir, all_files),
+            daemon=True
+        ).start()
+    
+    def _process_folder_worker(self, input_dir, all_files):
+        """Batch process folder (worker thread)."""
         try:
-            input_dir = Path(folder_path)
+            from src.docx_extractor.pdf_converter import make_conversion_pool
+            
             output_dir = input_dir / "output"
             output_dir.mkdir(exist_ok=True)
             
-            pdf_files = list(input_dir.glob("*.pdf"))
-            docx_files = list(input_dir.glob("*.docx"))
-            all_files = pdf_files + docx_files
-            
-            if not all_files:
-                self.write_log("\n⚠️ No PDF or Word files found")
-                messagebox.showwarning("No Files", "No files found in folder.")
-                self.enable_buttons()
-                return
-            
             self.write_log(f"\nFound {len(all_files)} file(s):\n")
             for f in all_files:
                 self.write_log(f"  • {f.name}")
@@ -269,7 +340,13 @@ class ExtractorGUI:
                 
                 try:
                     output_file = output_dir / f"{file_path.stem}_output.xlsx"
-                    self.extractor.process_file(file_path, output_file)
+                    # Convert in a fresh worker process (none is started for
+                    # .docx input), so memory pdf2docx leaks doesn't pile up
+                    # in the GUI over a whole folder
+                    with make_conversion_pool(1) as pool:
+                        self.extractor.process_file(
+                            file_path, output_file, conversion_pool=pool
+                        )
                     self.write_log("✅")
                     success_count += 1
                 except Exception as e:
@@ -285,7 +362,16 @@ class ExtractorGUI:
             self.write_log("="*70 + "\n")
             
             self.update_status("Ready")
+            self.run_on_ui(self._folder_done, success_count, error_count, output_dir)
             
+        except Exception as e:
+            self.write_log(f"\n❌ ERROR: {str(e)}")
+            self.write_log(traceback.format_exc())
+            self.run_on_ui(self._failed, e)
+    
+    def _folder_done(self, success_count, error_count, output_dir):
+        """Report batch result (Tk thread)."""
+        try:
             result = messagebox.askyesno(
                 "Batch Complete",
                 f"Processing complete!\n\n✅ Success: {success_count}\n❌ Failed: {error_count}\n\nOpen folder?",
@@ -295,12 +381,11 @@ class ExtractorGUI:
             if result:
                 import os
                 os.startfile(output_dir)
-            
         except Exception as e:
+            # e.g. os.startfile only exists on Windows
             self.write_log(f"\n❌ ERROR: {str(e)}")
             self.write_log(traceback.format_exc())
             messagebox.showerror("Error", f"Failed:\n\n{str(e)}")
-        
         finally:
             self.enable_buttons()
 
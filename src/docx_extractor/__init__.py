@@ -9,6 +9,7 @@ __author__ = "Mile Mišić"
 
 from .extractor import DocxTableExtractor
 from .pdf_converter import PDFConverter
+from .pymupdf_extractor import PyMuPDFExtractor
 
-__all__ = ["DocxTableExtractor", "PDFConverter"]
+__all__ = ["DocxTableExtractor", "PDFConverter", "PyMuPDFExtractor"]
 
@@ -1,21 +1,146 @@
+import multiprocessing
+import os
 import re
+import numpy as np
 import pandas as pd
+import xlsxwriter
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from pathlib import Path
-from docx import Document
-
-from .utils import is_section_heading, clean_numeric_like, clean_sheet_name
-from .pdf_converter import PDFConverter
-
-
-# --- regex helpers ---
+from typing import Optional
+import zipfile
+from lxml import etree
+
+from .utils import (
+    SHEET_NAME_MAX_LENGTH,
+    clean_numeric_like_series,
+    clean_sheet_name,
+    is_section_heading,
+    unique_sheet_name,
+)
+from .pdf_converter import DEFAULT_CACHE_DIR, PDFConverter, _convert_one, make_conversion_pool
+from .pymupdf_extractor import PyMuPDFExtractor
+
+
+# --- text helpers ---
 _DIGIT_RE = re.compile(r"\d")
 
 # Unicode superscripts: ¹²³ plus ⁰–⁹ (U+2070–U+2079)
-_UNICODE_SUP_RE = re.compile(r"[\u00B9\u00B2\u00B3\u2070-\u2079]")
+_UNICODE_SUP_CHARS = frozenset("\u00B9\u00B2\u00B3" + "".join(map(chr, range(0x2070, 0x207A))))
 
 # Unicode subscripts: ₀–₉ (U+2080–U+2089). (There are also letter subscripts in phonetic sets,
 # but for your "numeric subscripts in numbers" this is the relevant block.)
-_UNICODE_SUB_RE = re.compile(r"[\u2080-\u2089]")
+_UNICODE_SUB_CHARS = frozenset(map(chr, range(0x2080, 0x208A)))
+
+# --- raw WordprocessingML access (skips python-docx Paragraph/Run/Font wrappers) ---
+_W_NS = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+
+# Same runs as cell.paragraphs -> para.runs
+_RUNS_XP = etree.XPath("./w:p/w:r", namespaces=_W_NS)
+_SZ_XP = etree.XPath("string(w:rPr/w:sz/@w:val)", namespaces=_W_NS)
+_VERT_ALIGN_XP = etree.XPath("string(w:rPr/w:vertAlign/@w:val)", namespaces=_W_NS)
+# Concatenated text of a body paragraph (heading detection)
+_STRING_XP = etree.XPath("string(.)")
+
+# Main document part inside the .docx package, and the body-level blocks we stream.
+# The part is found through the package relationships, as python-docx does;
+# "word/document.xml" is only the usual name.
+_PACKAGE_RELS_PART = "_rels/.rels"
+_OFFICE_DOCUMENT_REL = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+)
+_DOCUMENT_PART = "word/document.xml"
+_BODY_TAG = f"{{{_W_NS['w']}}}body"
+_P_TAG = f"{{{_W_NS['w']}}}p"
+_TBL_TAG = f"{{{_W_NS['w']}}}tbl"
+
+
+# Bits of the per-cell flag matrix
+_SUP_BIT = 1
+_SUB_BIT = 2
+
+# Flag sheets (and npz keys) are named <data sheet> + suffix
+_SUP_SUFFIX = "_SUP"
+_SUB_SUFFIX = "_SUB"
+
+# Where export_to_excel puts the superscript/subscript flag matrices
+_FLAGS_FORMATS = ("excel", "npz")
+
+# First sheet of a single-workbook batch: which file each "<n>_" sheet
+# prefix stands for
+_FILE_INDEX_SHEET = "Files"
+
+
+def _main_document_part(package):
+    """Name of the main document part in an open .docx zip package."""
+    try:
+        rels = etree.fromstring(package.read(_PACKAGE_RELS_PART))
+    except KeyError:
+        return _DOCUMENT_PART
+    for rel in rels:
+        if rel.get("Type") == _OFFICE_DOCUMENT_REL and rel.get("TargetMode") != "External":
+            # Targets are relative to the package root, or absolute ("/word/...")
+            return rel.get("Target").lstrip("/")
+    return _DOCUMENT_PART
+
+
+def _table_arrays(rows):
+    """
+    Preallocate the (data, flags) matrices for a table given its rows of cells.
+
+    Rows can differ in length, so the width is that of the longest row;
+    unfilled positions stay None in data and 0 in flags.
+    """
+    shape = (len(rows), max(map(len, rows), default=0))
+    return np.empty(shape, dtype=object), np.zeros(shape, dtype=np.uint8)
+
+
+def _font_size_emu(sz):
+    """A w:sz value in EMU, the same as int(ST_HpsMeasure.convert_from_xml(sz))."""
+    if sz.isascii() and sz.isdigit():
+        return int(sz) * 6350  # half-points; 12700 EMU per point
+    # Rare universal-measure form ("12pt"); let python-docx parse it
+    from docx.oxml.simpletypes import ST_HpsMeasure
+
+    return int(ST_HpsMeasure.convert_from_xml(sz))
+
+
+def _has_small_digit_run(run_sizes, ratio):
+    """
+    True if a run with a digit is smaller than ratio * the median run size.
+
+    run_sizes is a non-empty list of (has_digit, size) pairs for one cell.
+    The median matches statistics.median (mean of the middle two for an
+    even count) without its per-call overhead.
+    """
+    sizes = sorted([size for _, size in run_sizes])
+    mid = len(sizes) // 2
+    median = sizes[mid] if len(sizes) % 2 else (sizes[mid - 1] + sizes[mid]) / 2
+    threshold = ratio * median
+    for has_digit, size in run_sizes:
+        if has_digit and size < threshold:
+            return True
+    return False
+
+
+def _write_sheet(workbook, name, header, rows):
+    """Write a header row and data rows to a new worksheet, in row order."""
+    ws = workbook.add_worksheet(name)
+    ws.write_row(0, 0, list(header))
+    for r, row in enumerate(rows, start=1):
+        ws.write_row(r, 0, row)
+
+
+def _extract_one(settings, source_path, output_path, cleanup):
+    """
+    Worker entry point for the extraction stage of batch_process.
+
+    Module-level so it can be pickled; each worker process builds its own
+    extractor from the parent's settings.
+    """
+    extractor = DocxTableExtractor(**settings)
+    extractor._extract_and_export(source_path, output_path, cleanup)
+    return output_path
 
 
 class DocxTableExtractor:
@@ -24,23 +149,32 @@ class DocxTableExtractor:
         clean_data: bool = True,
         auto_convert_pdf: bool = True,
         small_font_ratio: float = 0.70,  # used only for superscript heuristic
+        use_pymupdf: bool = False,  # read PDF tables directly, no DOCX step
+        flags_format: str = "excel",  # "npz": flags in a .flags.npz next to the workbook
+        cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,  # PDF -> DOCX conversion cache; None disables
     ):
+        if flags_format not in _FLAGS_FORMATS:
+            raise ValueError(f"flags_format must be one of {_FLAGS_FORMATS}, got {flags_format!r}")
         self.clean_data = clean_data
         self.auto_convert_pdf = auto_convert_pdf
         self.small_font_ratio = small_font_ratio
-        self.pdf_converter = PDFConverter() if auto_convert_pdf else None
+        self.use_pymupdf = use_pymupdf
+        self.flags_format = flags_format
+        self.cache_dir = cache_dir
+        self.pdf_converter = PDFConverter(cache_dir=cache_dir) if auto_convert_pdf else None
+        self.pymupdf_extractor = PyMuPDFExtractor() if use_pymupdf else None
 
     def _cell_text_and_flags(self, cell):
         """
         Returns (cell_text, sup_flag, sub_flag)
 
         Superscript flag criteria:
-          A) Explicit: run.font.superscript == True AND digit present in the run
+          A) Explicit: run vertAlign == superscript AND digit present in the run
           B) Unicode superscript digits present (¹²³⁰–⁹)
           C) Heuristic: numeric run font size < ratio * median cell font size
 
         Subscript flag criteria:
-          A) Explicit: run.font.subscript == True AND digit present in the run
+          A) Explicit: run vertAlign == subscript AND digit present in the run
           B) Unicode subscript digits present (₀–₉)
 
         Notes:
@@ -50,105 +184,179 @@ class DocxTableExtractor:
         text = cell.text.strip()
 
         # Unicode markers (cheap, high precision)
-        sup_unicode = bool(_UNICODE_SUP_RE.search(text))
-        sub_unicode = bool(_UNICODE_SUB_RE.search(text))
+        sup_unicode = not _UNICODE_SUP_CHARS.isdisjoint(text)
+        sub_unicode = not _UNICODE_SUB_CHARS.isdisjoint(text)
 
-        runs = []
-        sizes = []
+        # Explicit and heuristic flags need a digit in some run; runs are the
+        # cell's text, so a digit-free cell (labels, headers) can stop here.
+        # Unicode super/subscripts are not matched by \d, hence kept above.
+        if not _DIGIT_RE.search(text):
+            return text, sup_unicode, sub_unicode
 
-        for para in cell.paragraphs:
-            for run in para.runs:
-                rtxt = (run.text or "").strip()
-                if not rtxt:
-                    continue
-                runs.append(run)
-                if run.font.size is not None:
-                    sizes.append(int(run.font.size))
+        runs = []  # (run element, has_digit) per non-empty run
+
+        for r in _RUNS_XP(cell._tc):
+            rtxt = r.text.strip()
+            if not rtxt:
+                continue
+            runs.append((r, bool(_DIGIT_RE.search(rtxt))))
 
         # Explicit flags from run properties
         sup_explicit = False
         sub_explicit = False
-        for run in runs:
-            rtxt = run.text or ""
-            if not _DIGIT_RE.search(rtxt):
+        for r, has_digit in runs:
+            if not has_digit:
                 continue
-            if run.font.superscript is True:
+            vert_align = _VERT_ALIGN_XP(r)
+            if vert_align == "superscript":
                 sup_explicit = True
-            if run.font.subscript is True:
+            if vert_align == "subscript":
                 sub_explicit = True
             if sup_explicit and sub_explicit:
                 break
 
-        # Superscript heuristic (only if we still haven't flagged superscript explicitly/unicode)
+        # Superscript heuristic (only if we still haven't flagged superscript explicitly/unicode);
+        # font sizes are only read when it is actually needed.
         sup_heur = False
-        if not (sup_unicode or sup_explicit) and sizes:
-            sizes.sort()
-            n = len(sizes)
-            median = sizes[n // 2] if n % 2 else (sizes[n // 2 - 1] + sizes[n // 2]) / 2
-            threshold = self.small_font_ratio * median
-
-            for run in runs:
-                rtxt = run.text or ""
-                if not _DIGIT_RE.search(rtxt):
-                    continue
-                if run.font.size is not None and int(run.font.size) < threshold:
-                    sup_heur = True
-                    break
+        if not (sup_unicode or sup_explicit):
+            run_sizes = []
+            for r, has_digit in runs:
+                sz = _SZ_XP(r)
+                if sz:
+                    run_sizes.append((has_digit, _font_size_emu(sz)))
+
+            if run_sizes:
+                sup_heur = _has_small_digit_run(run_sizes, self.small_font_ratio)
 
         sup_flag = bool(sup_unicode or sup_explicit or sup_heur)
         sub_flag = bool(sub_unicode or sub_explicit)
 
         return text, sup_flag, sub_flag
 
+    def _pdf_cell_text_and_flags(self, cell_text, sup_text):
+        """
+        Returns (cell_text, sup_flag, sub_flag) for a cell read by PyMuPDF.
+
+        Same criteria as _cell_text_and_flags, except that the explicit
+        superscript check uses spans PyMuPDF marks as superscript (its own
+        size/baseline test, which also stands in for the size heuristic).
+        """
+        text = cell_text.strip()
+
+        sup_flag = (
+            not _UNICODE_SUP_CHARS.isdisjoint(text)
+            or bool(_DIGIT_RE.search(sup_text))
+        )
+        sub_flag = not _UNICODE_SUB_CHARS.isdisjoint(text)
+
+        return text, sup_flag, sub_flag
+
     # ---------------------------------------------------------
     # Table extraction
     # ---------------------------------------------------------
+    def _table_payload(self, data, flags):
+        df = pd.DataFrame(data)
+
+        if self.clean_data:
+            df = df.apply(clean_numeric_like_series)
+
+        # Superscript/subscript flags packed into one uint8 matrix
+        # (_SUP_BIT | _SUB_BIT); decoded into sheets at export.
+        return {"data": df, "flags": flags}
+
     def extract_tables_by_section(self, docx_path):
         docx_path = Path(docx_path)
         if not docx_path.exists():
             raise FileNotFoundError(f"File not found: {docx_path}")
 
+        # python-docx is only needed for DOCX input, so import it here
+        from docx.oxml.parser import element_class_lookup
+        from docx.table import Table
+
         print(f"Extracting from: {docx_path.name}")
-        doc = Document(str(docx_path))
 
         tables_by_section = {}
         current_section = None
 
-        for block in doc.element.body:
-            if block.tag.endswith("p"):
-                text = block.xpath("string(.)").strip()
-                if is_section_heading(text):
-                    current_section = text
-                    tables_by_section.setdefault(current_section, [])
+        # Stream body-level paragraphs and tables from document.xml instead of
+        # loading the whole document tree; only the current block is kept.
+        with zipfile.ZipFile(docx_path) as package, \
+                package.open(_main_document_part(package)) as stream:
+            blocks = etree.iterparse(
+                stream, events=("end",), tag=(_P_TAG, _TBL_TAG), remove_blank_text=True
+            )
+            # python-docx element classes, so Table/_Cell work on streamed elements
+            blocks.set_element_class_lookup(element_class_lookup)
+
+            for _, block in blocks:
+                body = block.getparent()
+                if body is None or body.tag != _BODY_TAG:
+                    continue  # nested in a table cell; read with its table
+
+                if block.tag == _P_TAG:
+                    text = _STRING_XP(block).strip()
+                    if is_section_heading(text):
+                        current_section = text
+                        tables_by_section.setdefault(current_section, [])
+
+                else:
+                    rows = [row.cells for row in Table(block, None).rows]
+                    data, flags = _table_arrays(rows)
+
+                    for i, cells in enumerate(rows):
+                        for j, cell in enumerate(cells):
+                            cell_text, sup_flag, sub_flag = self._cell_text_and_flags(cell)
+                            data[i, j] = cell_text
+                            flags[i, j] = (
+                                (_SUP_BIT if sup_flag else 0) | (_SUB_BIT if sub_flag else 0)
+                            )
+
+                    payload = self._table_payload(data, flags)
 
-            elif block.tag.endswith("tbl"):
-                table = next(t for t in doc.tables if t._element is block)
+                    if current_section:
+                        tables_by_section[current_section].append(payload)
+                    else:
+                        tables_by_section.setdefault("UNSECTIONED", []).append(payload)
 
-                data = []
-                sup_flags = []
-                sub_flags = []
+                # Processed blocks are no longer needed; drop them to bound memory
+                block.clear(keep_tail=True)
+                while block.getprevious() is not None:
+                    del body[0]
+
+        total = sum(len(v) for v in tables_by_section.values())
+        print(f"Extracted {total} tables from {len(tables_by_section)} sections")
+        return tables_by_section
+
+    def extract_tables_from_pdf(self, pdf_path):
+        """Same output as extract_tables_by_section, read directly from a PDF."""
+        pdf_path = Path(pdf_path)
+        if self.pymupdf_extractor is None:
+            raise ValueError("PDF table reading requires use_pymupdf=True")
+
+        print(f"Extracting from: {pdf_path.name}")
+
+        tables_by_section = {}
+        current_section = None
 
-                for row in table.rows:
-                    row_data = []
-                    row_sup = []
-                    row_sub = []
-                    for cell in row.cells:
-                        cell_text, sup_flag, sub_flag = self._cell_text_and_flags(cell)
-                        row_data.append(cell_text)
-                        row_sup.append(int(sup_flag))
-                        row_sub.append(int(sub_flag))
-                    data.append(row_data)
-                    sup_flags.append(row_sup)
-                    sub_flags.append(row_sub)
+        for kind, value in self.pymupdf_extractor.iter_blocks(pdf_path):
+            if kind == "p":
+                text = value.strip()
+                if is_section_heading(text):
+                    current_section = text
+                    tables_by_section.setdefault(current_section, [])
 
-                df = pd.DataFrame(data)
-                sup_df = pd.DataFrame(sup_flags)
-                sub_df = pd.DataFrame(sub_flags)
+            else:
+                data, flags = _table_arrays(value)
 
-                if self.clean_data:
-                    df = df.applymap(clean_numeric_like)
+                for i, row in enumerate(value):
+                    for j, (cell_text, sup_text) in enumerate(row):
+                        cell_text, sup_flag, sub_flag = self._pdf_cell_text_and_flags(
+                            cell_text, sup_text
+                        )
+                        data[i, j] = cell_text
+                        flags[i, j] = (_SUP_BIT if sup_flag else 0) | (_SUB_BIT if sub_flag else 0)
 
-                payload = {"data": df, "sup_flags": sup_df, "sub_flags": sub_df}
+                payload = self._table_payload(data, flags)
 
                 if current_section:
                     tables_by_section[current_section].append(payload)
@@ -162,63 +370,227 @@ class DocxTableExtractor:
     # ---------------------------------------------------------
     # Excel export
     # ---------------------------------------------------------
-    def export_to_excel(self, tables_by_section, output_path):
+    def export_to_excel(self, tables_by_section, output_path, workbook=None, sheet_prefix=""):
+        """
+        Write one data sheet per table plus its _SUP/_SUB flag sheets.
+
+        With flags_format="npz" the flag sheets are left out and the flag
+        matrices are saved instead to <output>.flags.npz, keyed
+        "<data sheet>_SUP" / "<data sheet>_SUB" (0/1 uint8 arrays).
+
+        If an open xlsxwriter workbook is passed, the sheets are added to it
+        (names starting with sheet_prefix) and nothing is written to
+        output_path itself; it then only locates the .flags.npz file.
+        """
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with pd.ExcelWriter(output_path, engine="xlsxwriter") as writer:
-            for section, tables in tables_by_section.items():
-                for idx, payload in enumerate(tables):
-                    base = clean_sheet_name(f"{section}_{idx}")
-
-                    payload["data"].to_excel(writer, sheet_name=base, index=False)
-                    payload["sup_flags"].to_excel(
-                        writer,
-                        sheet_name=clean_sheet_name(f"{base}_SUP"),
-                        index=False,
-                    )
-                    payload["sub_flags"].to_excel(
-                        writer,
-                        sheet_name=clean_sheet_name(f"{base}_SUB"),
-                        index=False,
-                    )
-
-        print(f"Exported to {output_path.name}")
+        if workbook is not None:
+            flag_arrays = self._write_tables(workbook, tables_by_section, sheet_prefix)
+        else:
+            # No constant_memory: it keeps a temp file open per worksheet until
+            # close(), which runs out of file handles on documents with hundreds
+            # of tables. Sheets are written whole, one at a time, so it saved little.
+            with xlsxwriter.Workbook(str(output_path)) as workbook:
+                flag_arrays = self._write_tables(workbook, tables_by_section, sheet_prefix)
+            print(f"Exported to {output_path.name}")
+
+        if flag_arrays is not None:
+            flags_path = output_path.with_suffix(".flags.npz")
+            np.savez_compressed(flags_path, **flag_arrays)
+            print(f"Exported flags to {flags_path.name}")
+
+    def _write_tables(self, workbook, tables_by_section, sheet_prefix=""):
+        """Add the sheets for tables_by_section; returns the npz flag arrays, if any."""
+        flag_arrays = {} if self.flags_format == "npz" else None
+        used_names = {name.lower() for name in workbook.sheetnames}
+
+        for section, tables in tables_by_section.items():
+            for idx, payload in enumerate(tables):
+                # The flag sheets are named <data sheet>_SUP / _SUB, so the data
+                # name leaves room for the suffix and is only taken if both
+                # flag names are free too (they are reserved along with it)
+                base = clean_sheet_name(
+                    f"{sheet_prefix}{section}_{idx}", SHEET_NAME_MAX_LENGTH - len(_SUP_SUFFIX)
+                )
+                sheet_name = unique_sheet_name(
+                    base, used_names, SHEET_NAME_MAX_LENGTH - len(_SUP_SUFFIX),
+                    (_SUP_SUFFIX, _SUB_SUFFIX),
+                )
+                df = payload["data"]
+                flags = payload["flags"]
+
+                _write_sheet(
+                    workbook,
+                    sheet_name,
+                    df.columns,
+                    df.astype(object).where(df.notna(), None).itertuples(index=False, name=None),
+                )
+
+                if flag_arrays is not None:
+                    flag_arrays[sheet_name + _SUP_SUFFIX] = np.bitwise_and(flags, _SUP_BIT)
+                    flag_arrays[sheet_name + _SUB_SUFFIX] = np.right_shift(flags, 1)
+                    continue
+
+                _write_sheet(
+                    workbook,
+                    sheet_name + _SUP_SUFFIX,
+                    range(flags.shape[1]),
+                    np.bitwise_and(flags, _SUP_BIT).tolist(),
+                )
+                _write_sheet(
+                    workbook,
+                    sheet_name + _SUB_SUFFIX,
+                    range(flags.shape[1]),
+                    np.right_shift(flags, 1).tolist(),
+                )
+
+        return flag_arrays
 
     # ---------------------------------------------------------
     # File-level processing
     # ---------------------------------------------------------
-    def process_file(self, input_path, output_path, keep_intermediate=False):
-        input_path = Path(input_path)
-        output_path = Path(output_path)
-
+    def _extraction_source(self, input_path, keep_intermediate):
+        """Returns (path to extract from, needs_conversion, cleanup) for an input file."""
         if input_path.suffix.lower() == ".pdf":
+            if self.use_pymupdf:
+                return input_path, False, False
             if not self.auto_convert_pdf:
                 raise ValueError("PDF input but auto_convert_pdf=False")
-            temp_docx = input_path.with_suffix(".docx")
-            self.pdf_converter.convert(input_path, temp_docx)
-            docx_path = temp_docx
-            cleanup = not keep_intermediate
+            return input_path.with_suffix(".docx"), True, not keep_intermediate
+        return input_path, False, False
+
+    def _extract_and_export(
+        self, source_path, output_path, cleanup=False, workbook=None, sheet_prefix=""
+    ):
+        if source_path.suffix.lower() == ".pdf":
+            tables = self.extract_tables_from_pdf(source_path)
         else:
-            docx_path = input_path
-            cleanup = False
+            tables = self.extract_tables_by_section(source_path)
+        self.export_to_excel(tables, output_path, workbook, sheet_prefix)
+
+        if cleanup and source_path.exists():
+            source_path.unlink()
 
-        tables = self.extract_tables_by_section(docx_path)
-        self.export_to_excel(tables, output_path)
+    def process_file(
+        self,
+        input_path,
+        output_path,
+        keep_intermediate=False,
+        workbook=None,
+        sheet_prefix="",
+        conversion_pool=None,
+    ):
+        """
+        Extract the tables of one PDF/DOCX file and export them to Excel.
+
+        Pass a conversion_pool (see make_conversion_pool) when calling this
+        repeatedly from a long-lived process, so each PDF is converted in a
+        fresh worker instead of growing this process's memory.
+        """
+        input_path = Path(input_path)
+        output_path = Path(output_path)
+
+        source_path, convert, cleanup = self._extraction_source(input_path, keep_intermediate)
+        if convert:
+            self.pdf_converter.convert(input_path, source_path, pool=conversion_pool)
 
-        if cleanup and docx_path.exists():
-            docx_path.unlink()
+        self._extract_and_export(source_path, output_path, cleanup, workbook, sheet_prefix)
 
     # ---------------------------------------------------------
     # Batch processing
     # ---------------------------------------------------------
+    def _run_pipeline(self, jobs, keep_intermediate, workers):
+        """
+        Two-stage pipeline: PDF -> DOCX conversion and DOCX -> Excel
+        extraction run in separate process pools, so extraction of one file
+        overlaps conversion of the next. Both stages are CPU-bound Python,
+        hence processes rather than threads.
+
+        At most 2 * workers files are in flight at once, which bounds the
+        number of intermediate .docx files waiting on disk. Conversions get
+        their own short-lived, capped workers (see make_conversion_pool).
+        The conversion cache is only read and updated here in the parent,
+        as in PDFConverter.batch_convert, since its index is not locked.
+        """
+        settings = {
+            "clean_data": self.clean_data,
+            "auto_convert_pdf": self.auto_convert_pdf,
+            "small_font_ratio": self.small_font_ratio,
+            "use_pymupdf": self.use_pymupdf,
+            "flags_format": self.flags_format,
+            "cache_dir": self.cache_dir,
+        }
+        pending = deque(jobs)
+        # future -> (input file, output path, docx path, cleanup, stage, cache key)
+        in_flight = {}
+        max_in_flight = 2 * workers
+
+        # Extraction workers are spawned too: the conversion pool's manager
+        # thread is already running when they start, and forking a process
+        # with threads can deadlock the child
+        with make_conversion_pool(workers) as convert_pool, \
+                ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+                ) as extract_pool:
+
+            def submit_extract(f, out, source_path, cleanup):
+                future = extract_pool.submit(_extract_one, settings, source_path, out, cleanup)
+                in_flight[future] = (f, out, source_path, cleanup, "extract", None)
+
+            while pending or in_flight:
+                while pending and len(in_flight) < max_in_flight:
+                    f, out = pending.popleft()
+                    print(f"Processing {f.name}...")
+                    try:
+                        source_path, convert, cleanup = self._extraction_source(f, keep_intermediate)
+                        key = self.pdf_converter._cache_key(f) if convert else None
+                    except Exception as e:
+                        print(f"Error processing {f.name}: {e}")
+                        continue
+                    if convert and not self.pdf_converter._cache_fetch(key, source_path):
+                        future = convert_pool.submit(_convert_one, f, source_path)
+                        in_flight[future] = (f, out, source_path, cleanup, "convert", key)
+                    else:
+                        submit_extract(f, out, source_path, cleanup)
+
+                if not in_flight:
+                    continue
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    f, out, source_path, cleanup, stage, key = in_flight.pop(future)
+                    try:
+                        future.result()
+                    except Exception as e:
+                        print(f"Error processing {f.name}: {e}")
+                        continue
+                    if stage == "convert":
+                        self.pdf_converter._cache_store(key, source_path)
+                        submit_extract(f, out, source_path, cleanup)
+
     def batch_process(
         self,
         input_dir,
         output_dir,
         pattern="*.pdf",
         keep_intermediate=False,
+        max_workers=None,
+        single_workbook=False,
     ):
+        """
+        Process every file matching pattern in input_dir.
+
+        By default each file gets its own <name>_tables.xlsx. With
+        single_workbook=True all tables go into one <input dir>_tables.xlsx,
+        with sheet names prefixed by the file's number in the batch ("3_...")
+        and a first "Files" sheet mapping the numbers to file names; files
+        are then processed one after another, since a workbook can't be
+        shared between worker processes. A file's tables are fully extracted before any of its
+        sheets are added, so a file that fails to convert or extract adds
+        nothing; only an error while writing its sheets can leave some of
+        them in the workbook.
+        """
         input_dir = Path(input_dir)
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -226,12 +598,37 @@ class DocxTableExtractor:
         files = sorted(input_dir.glob(pattern))
         print(f"Found {len(files)} files")
 
-        for f in files:
-            print(f"Processing {f.name}...")
-            try:
-                out = output_dir / f"{f.stem}_tables.xlsx"
-                self.process_file(f, out, keep_intermediate)
-            except Exception as e:
-                print(f"Error processing {f.name}: {e}")
+        jobs = [(f, output_dir / f"{f.stem}_tables.xlsx") for f in files]
+        workers = max_workers or os.cpu_count() or 1
+
+        if single_workbook:
+            output_path = output_dir / f"{input_dir.resolve().name}_tables.xlsx"
+            # Plain workbook, as in export_to_excel: constant_memory would hold a
+            # temp file open for every sheet of every file until close()
+            with xlsxwriter.Workbook(str(output_path)) as workbook:
+                # Numbers rather than (truncated) file names keep the prefix
+                # short and unique; the index sheet says which file is which
+                _write_sheet(
+                    workbook,
+                    _FILE_INDEX_SHEET,
+                    ["Prefix", "File"],
+                    [(f"{n}_", f.name) for n, (f, _) in enumerate(jobs, 1)],
+                )
+                for n, (f, out) in enumerate(jobs, 1):
+                    print(f"Processing {f.name}...")
+                    try:
+                        self.process_file(f, out, keep_intermediate, workbook, f"{n}_")
+                    except Exception as e:
+                        print(f"Error processing {f.name}: {e}")
+            print(f"Exported to {output_path.name}")
+        elif workers == 1 or len(jobs) <= 1:
+            for f, out in jobs:
+                print(f"Processing {f.name}...")
+                try:
+                    self.process_file(f, out, keep_intermediate)
+                except Exception as e:
+                    print(f"Error processing {f.name}: {e}")
+        else:
+            self._run_pipeline(jobs, keep_intermediate, workers)
 
         print("Done")
@@ -2,18 +2,74 @@
 PDF to Word conversion utilities.
 """
 
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Optional
+import hashlib
+import importlib.util
+import json
 import logging
+import os
+import shutil
+import sys
+
+# pdf2docx (and PyMuPDF/OpenCV under it) is slow to import, so it is only
+# looked up here and imported on first conversion.
+PDF2DOCX_AVAILABLE = importlib.util.find_spec("pdf2docx") is not None
 
 try:
-    from pdf2docx import Converter
-    PDF2DOCX_AVAILABLE = True
-except ImportError:
-    PDF2DOCX_AVAILABLE = False
+    from importlib.metadata import version as _package_version
+    PDF2DOCX_VERSION = _package_version("pdf2docx")
+except Exception:
+    PDF2DOCX_VERSION = "unknown"
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent pdf2docx conversions. Each one holds a whole
+# parsed PDF plus open file handles, so more workers than this mostly adds
+# memory pressure and risks "Too many open files".
+MAX_CONVERSION_WORKERS = 4
+
+# Conversion cache: previously converted .docx files keyed by PDF content
+DEFAULT_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "usgs_tables"
+)
+DEFAULT_CACHE_SIZE = 64
+_CACHE_INDEX = "index.json"
+
+
+def make_conversion_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Create a process pool for PDF conversions.
+    
+    Workers are bounded by MAX_CONVERSION_WORKERS and, on Python 3.11+,
+    replaced after every file, so memory pdf2docx leaks per document is
+    returned to the OS instead of accumulating over a long batch.
+    
+    Args:
+        max_workers: Requested worker count (default: CPU count), capped
+                     at MAX_CONVERSION_WORKERS
+    """
+    workers = min(max_workers or os.cpu_count() or 1, MAX_CONVERSION_WORKERS)
+    if sys.version_info >= (3, 11):
+        return ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1)
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def _convert_one(pdf_path: Path, docx_path: Path) -> Path:
+    """
+    Convert a single PDF in a worker process.
+
+    Kept at module level so it can be pickled by ProcessPoolExecutor.
+    """
+    from pdf2docx import Converter
+    
+    cv = Converter(str(pdf_path))
+    cv.convert(str(docx_path))
+    cv.close()
+    return docx_path
+
 
 class PDFConverter:
     """
@@ -22,18 +78,101 @@ class PDFConverter:
     
     """
     
-    def __init__(self):
-        """Initialize PDF converter."""
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+        cache_size: int = DEFAULT_CACHE_SIZE
+    ):
+        """
+        Initialize PDF converter.
+        
+        Args:
+            cache_dir: Directory for cached conversions, keyed by a hash of
+                       the PDF bytes and the pdf2docx version. None disables
+                       caching (default: ~/.cache/usgs_tables)
+            cache_size: Maximum number of cached .docx files; the least
+                        recently used are evicted first
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_size = cache_size
+        
         if not PDF2DOCX_AVAILABLE:
             logger.warning(
                 "pdf2docx library not installed. "
                 "Install with: pip install pdf2docx"
             )
     
+    # ---------------------------------------------------------
+    # Conversion cache
+    # ---------------------------------------------------------
+    def _cache_key(self, pdf_path: Path) -> Optional[str]:
+        """Hash of the PDF contents and converter version, or None if caching is off."""
+        if self.cache_dir is None:
+            return None
+        h = hashlib.blake2b(digest_size=16)
+        h.update(PDF2DOCX_VERSION.encode())
+        with open(pdf_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        return h.hexdigest()
+    
+    def _load_cache_index(self) -> "OrderedDict[str, None]":
+        try:
+            keys = json.loads((self.cache_dir / _CACHE_INDEX).read_text())
+        except (OSError, ValueError):
+            keys = []
+        return OrderedDict.fromkeys(keys)
+    
+    def _save_cache_index(self, index: "OrderedDict[str, None]"):
+        # Write-then-rename so readers never see a partial index. Updates are
+        # not locked, so batch callers keep all cache bookkeeping in one process.
+        tmp = self.cache_dir / f"{_CACHE_INDEX}.{os.getpid()}.tmp"
+        tmp.write_text(json.dumps(list(index)))
+        os.replace(tmp, self.cache_dir / _CACHE_INDEX)
+    
+    def _cache_fetch(self, key: Optional[str], docx_path: Path) -> bool:
+        """Copy a cached conversion to docx_path; returns False on a miss."""
+        if key is None:
+            return False
+        cached = self.cache_dir / f"{key}.docx"
+        if not cached.exists():
+            return False
+        try:
+            shutil.copyfile(cached, docx_path)
+            index = self._load_cache_index()
+            index[key] = None
+            index.move_to_end(key)
+            self._save_cache_index(index)
+        except OSError as e:
+            logger.warning(f"⚠️ Conversion cache read failed: {e}")
+            return False
+        return True
+    
+    def _cache_store(self, key: Optional[str], docx_path: Path):
+        """Add a fresh conversion to the cache, evicting the least recently used."""
+        if key is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_dir / f"{key}.{os.getpid()}.tmp"
+            shutil.copyfile(docx_path, tmp)
+            os.replace(tmp, self.cache_dir / f"{key}.docx")
+            
+            index = self._load_cache_index()
+            index[key] = None
+            index.move_to_end(key)
+            while len(index) > self.cache_size:
+                old, _ = index.popitem(last=False)
+                (self.cache_dir / f"{old}.docx").unlink(missing_ok=True)
+            self._save_cache_index(index)
+        except OSError as e:
+            logger.warning(f"⚠️ Conversion cache write failed: {e}")
+    
     def convert(
         self, 
         pdf_path: Path, 
-        docx_path: Optional[Path] = None
+        docx_path: Optional[Path] = None,
+        pool: Optional[ProcessPoolExecutor] = None
     ) -> Path:
         """
         Convert PDF to Word document.
@@ -42,6 +181,9 @@ class PDFConverter:
             pdf_path: Path to input PDF file
             docx_path: Path for output Word file (optional)
                       If not provided, uses same name with .docx extension
+            pool: Optional pool from make_conversion_pool; pdf2docx then runs
+                  in one of its single-use workers, so memory it leaks is
+                  freed with the worker. The cache is still handled here.
         
         Returns:
             Path to created Word document
@@ -73,12 +215,23 @@ class PDFConverter:
         else:
             docx_path = Path(docx_path)
         
+        key = self._cache_key(pdf_path)
+        if self._cache_fetch(key, docx_path):
+            logger.info(f"✅ Reused cached conversion: {docx_path.name}")
+            return docx_path
+        
         logger.info(f"Converting {pdf_path.name} → {docx_path.name}")
         
         try:
-            cv = Converter(str(pdf_path))
-            cv.convert(str(docx_path))
-            cv.close()
+            if pool is not None:
+                pool.submit(_convert_one, pdf_path, docx_path).result()
+            else:
+                from pdf2docx import Converter
+                
+                cv = Converter(str(pdf_path))
+                cv.convert(str(docx_path))
+                cv.close()
+            self._cache_store(key, docx_path)
             
             logger.info(f"✅ Conversion complete: {docx_path.name}")
             return docx_path
@@ -91,15 +244,23 @@ class PDFConverter:
         self, 
         input_dir: Path, 
         output_dir: Optional[Path] = None,
-        pattern: str = "*.pdf"
+        pattern: str = "*.pdf",
+        max_workers: Optional[int] = None
     ) -> List[Path]:
         """
         Convert multiple PDFs to Word format.
         
+        Files are converted in parallel worker processes, since pdf2docx
+        parsing is CPU-bound and would otherwise serialize on the GIL.
+        Each worker handles a single file (see make_conversion_pool).
+        
         Args:
             input_dir: Directory containing PDF files
             output_dir: Directory for Word files (default: same as input_dir)
             pattern: File pattern to match (default: *.pdf)
+            max_workers: Number of worker processes (default: os.cpu_count(),
+                         capped at MAX_CONVERSION_WORKERS)
+                         Use 1 to convert sequentially in this process
         
         Returns:
             List of paths to successfully created Word documents
@@ -119,18 +280,57 @@ class PDFConverter:
         pdf_files = sorted(input_dir.glob(pattern))
         logger.info(f"Found {len(pdf_files)} PDF files")
         
+        pairs = [
+            (pdf_path, output_dir / pdf_path.with_suffix('.docx').name)
+            for pdf_path in pdf_files
+        ]
+        workers = max_workers or os.cpu_count() or 1
+        
         converted_files = []
         failed_files = []
         
-        for pdf_path in pdf_files:
-            try:
-                docx_path = output_dir / pdf_path.with_suffix('.docx').name
-                converted_path = self.convert(pdf_path, docx_path)
-                converted_files.append(converted_path)
-            except Exception as e:
-                logger.warning(f"⚠️ Skipping {pdf_path.name}: {e}")
-                failed_files.append(pdf_path)
-                continue
+        if workers == 1 or len(pairs) <= 1 or not PDF2DOCX_AVAILABLE:
+            for pdf_path, docx_path in pairs:
+                try:
+                    converted_path = self.convert(pdf_path, docx_path)
+                    converted_files.append(converted_path)
+                except Exception as e:
+                    logger.warning(f"⚠️ Skipping {pdf_path.name}: {e}")
+                    failed_files.append(pdf_path)
+                    continue
+        else:
+            # Cache lookups and updates stay in this process; workers only convert
+            misses = []
+            for pdf_path, docx_path in pairs:
+                try:
+                    key = self._cache_key(pdf_path)
+                except OSError as e:
+                    logger.warning(f"⚠️ Skipping {pdf_path.name}: {e}")
+                    failed_files.append(pdf_path)
+                    continue
+                if self._cache_fetch(key, docx_path):
+                    logger.info(f"✅ Reused cached conversion: {docx_path.name}")
+                    converted_files.append(docx_path)
+                else:
+                    misses.append((pdf_path, docx_path, key))
+            
+            with make_conversion_pool(workers) as ex:
+                futures = {
+                    ex.submit(_convert_one, pdf_path, docx_path): (pdf_path, key)
+                    for pdf_path, docx_path, key in misses
+                }
+                for future in as_completed(futures):
+                    pdf_path, key = futures[future]
+                    try:
+                        docx_path = future.result()
+                        self._cache_store(key, docx_path)
+                        converted_files.append(docx_path)
+                        logger.info(f"✅ Conversion complete: {pdf_path.name}")
+                    except Exception as e:
+                        logger.warning(f"⚠️ Skipping {pdf_path.name}: {e}")
+                        failed_files.append(pdf_path)
+            # Report in input order, not completion order
+            converted_files.sort()
         
         logger.info(
             f"✅ Converted {len(converted_files)}/{len(pdf_files)} files"
@@ -141,4 +341,4 @@ class PDFConverter:
                 f"Failed conversions: {[f.name for f in failed_files]}"
             )
         
-        return converted_files
\ No newline at end of file
+        return converted_files
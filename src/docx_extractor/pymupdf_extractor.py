@@ -0,0 +1,141 @@
+"""
+Direct PDF table reading with PyMuPDF.
+
+Alternative to the PDF → DOCX → tables path: tables are located with
+PyMuPDF's page.find_tables() and read straight from the PDF, so no
+pdf2docx conversion or intermediate .docx file is needed.
+"""
+
+from pathlib import Path
+from typing import Iterator, List, Tuple, Union
+import importlib.util
+import logging
+
+# PyMuPDF is imported on first use; "fitz" is its name before 1.24
+PYMUPDF_AVAILABLE = any(
+    importlib.util.find_spec(name) is not None for name in ("pymupdf", "fitz")
+)
+
+logger = logging.getLogger(__name__)
+
+# Span flag PyMuPDF sets on superscripted text
+_SUPERSCRIPT_FLAG = 1
+
+# A table cell: (cell text, text of superscripted spans inside the cell)
+Cell = Tuple[str, str]
+
+
+class PyMuPDFExtractor:
+    """
+    Read text lines and tables from a PDF in reading order.
+    Uses the PyMuPDF (pymupdf / fitz) library.
+
+    """
+
+    def __init__(self, strategy: str = "text"):
+        """
+        Initialize PyMuPDF reader.
+
+        Args:
+            strategy: Table detection strategy passed to page.find_tables()
+                      USGS summaries rarely rule their tables, so the
+                      default "text" strategy aligns on words rather than
+                      drawn lines ("lines")
+        """
+        if not PYMUPDF_AVAILABLE:
+            logger.warning(
+                "PyMuPDF library not installed. "
+                "Install with: pip install pymupdf"
+            )
+        self.strategy = strategy
+
+    def iter_blocks(
+        self,
+        pdf_path: Path
+    ) -> Iterator[Tuple[str, Union[str, List[List[Cell]]]]]:
+        """
+        Yield page content in reading order, mirroring a DOCX body.
+
+        Yields:
+            ("p", text) for each text line outside a table
+            ("tbl", rows) for each table, where rows is a list of rows of
+            (cell_text, superscript_text) tuples
+
+        Raises:
+            ImportError: If PyMuPDF is not installed
+            FileNotFoundError: If PDF file doesn't exist
+        """
+        if not PYMUPDF_AVAILABLE:
+            raise ImportError(
+                "PyMuPDF library not installed. "
+                "Install with: pip install pymupdf"
+            )
+
+        pdf_path = Path(pdf_path)
+
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+
+        try:
+            import pymupdf
+        except ImportError:
+            import fitz as pymupdf
+
+        with pymupdf.open(str(pdf_path)) as doc:
+            for page in doc:
+                yield from self._page_blocks(page)
+
+    def _page_blocks(self, page):
+        tables = page.find_tables(strategy=self.strategy).tables
+        table_rects = [t.bbox for t in tables]
+
+        items = []  # (y0, x0, kind, value)
+        superscripts = []  # (span centre, span text)
+
+        for block in page.get_text("dict")["blocks"]:
+            for line in block.get("lines", ()):
+                for span in line["spans"]:
+                    if span["flags"] & _SUPERSCRIPT_FLAG:
+                        superscripts.append((_centre(span["bbox"]), span["text"]))
+
+                centre = _centre(line["bbox"])
+                if any(_contains(rect, centre) for rect in table_rects):
+                    continue
+                text = "".join(span["text"] for span in line["spans"])
+                items.append((line["bbox"][1], line["bbox"][0], "p", text))
+
+        for table in tables:
+            rows = self._table_rows(table, superscripts)
+            items.append((table.bbox[1], table.bbox[0], "tbl", rows))
+
+        items.sort(key=lambda item: (item[0], item[1]))
+        for _, _, kind, value in items:
+            yield kind, value
+
+    @staticmethod
+    def _table_rows(table, superscripts) -> List[List[Cell]]:
+        texts = table.extract()
+        rows = []
+        for r, row in enumerate(table.rows):
+            cells = []
+            for c, bbox in enumerate(row.cells):
+                text = texts[r][c] or ""
+                sup_text = ""
+                if bbox is not None:
+                    sup_text = "".join(
+                        s for centre, s in superscripts if _contains(bbox, centre)
+                    )
+                cells.append((text, sup_text))
+            rows.append(cells)
+        return rows
+
+
+def _centre(bbox):
+    x0, y0, x1, y1 = bbox
+    return (x0 + x1) / 2, (y0 + y1) / 2
+
+
+def _contains(bbox, point):
+    x0, y0, x1, y1 = bbox
+    x, y = point
+    return x0 <= x < x1 and y0 <= y < y1
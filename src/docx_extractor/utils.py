@@ -2,11 +2,34 @@
 Utility functions for text cleaning and validation.
 """
 
+import os
 import re
-from typing import Optional
-from pathlib import Path
+import string
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence, Set
 
+if TYPE_CHECKING:
+    import pandas as pd
 
+
+# Excel's limit on worksheet name length
+SHEET_NAME_MAX_LENGTH = 31
+
+# Everything from the first newline onwards
+_AFTER_FIRST_LINE_RE = re.compile(r"\n.*", re.DOTALL)
+
+# Cell values that mean "no data" (compared upper-cased); none is longer than 3
+_MISSING_VALUES = frozenset({"NA", "N/A", "XX", "W"})
+
+# Characters allowed in section headings, besides whitespace
+_HEADING_CHARS = frozenset(string.ascii_uppercase + string.digits + "()/-")
+
+# Characters Excel does not allow in sheet names
+_INVALID_SHEET_CHARS_RE = re.compile(r"[\[\]\:\*\?\/\\]")
+
+
+# Page headers and repeated labels make many paragraph texts recur
+@lru_cache(maxsize=2048)
 def is_section_heading(text: str) -> bool:
     """
     Detect all-caps section headings (e.g., 'COBALT', 'LITHIUM').
@@ -35,8 +58,16 @@ def is_section_heading(text: str) -> bool:
     if not text:
         return False
     
-    pattern = re.compile(r"^[A-Z][A-Z\s\(\)\/\-0-9]*$")
-    return bool(pattern.match(text.strip())) and len(text.strip()) > 2
+    text = text.strip()
+    if len(text) < 3 or not ("A" <= text[0] <= "Z"):
+        return False
+    
+    # Same test as the pattern ^[A-Z][A-Z\s()/\-0-9]*$ (\s is str.isspace),
+    # without the regex engine; stops at the first disallowed character
+    for c in text:
+        if c not in _HEADING_CHARS and not c.isspace():
+            return False
+    return True
 
 def clean_numeric_like(s: Optional[str]) -> str:
     """
@@ -60,21 +91,66 @@ def clean_numeric_like(s: Optional[str]) -> str:
     s = s.strip()
     
     # Handle obvious missing values
-    if s.upper() in {"NA", "N/A", "XX", "W"}:
+    # (upper() never shortens text, so longer cells can't match)
+    if len(s) <= 3 and s.upper() in _MISSING_VALUES:
         return ""
     
-    # ONLY fix: Multi-line cells (Excel doesn't like these)
-    if '\n' in s or '\r' in s:
-        lines = [line.strip() for line in s.split('\n') if line.strip()]
-        s = lines[0] if lines else ""
+    # ONLY fix: Multi-line cells (Excel doesn't like these).
+    # s is stripped, so its first line is non-empty: cut at the first newline
+    newline = s.find('\n')
+    if newline >= 0:
+        s = s[:newline]
     
     # Remove tabs (Excel formatting issue)
-    s = s.replace('\t', ' ')
+    if '\t' in s:
+        s = s.replace('\t', ' ')
     
     # That's it! Keep everything else as-is
     return s.strip()
 
-def clean_sheet_name(name: str, max_length: int = 31) -> str:
+def clean_numeric_like_series(col: "pd.Series") -> "pd.Series":
+    """
+    Column-wise equivalent of clean_numeric_like.
+    
+    Applies the same minimal cleaning to a whole column using pandas string
+    methods instead of one Python call per cell. Use with DataFrame.apply:
+    
+        df = df.apply(clean_numeric_like_series)
+    
+    Args:
+        col: Column of cell strings (missing cells may be None/NaN)
+        
+    Returns:
+        Cleaned column of strings
+    """
+    s = col.fillna("").astype(str).str.strip()
+    
+    # Handle obvious missing values
+    missing = s.str.upper().isin(_MISSING_VALUES)
+    
+    # Multi-line cells: keep the first line (s is stripped, so it is non-empty)
+    s = s.str.replace(_AFTER_FIRST_LINE_RE, "", regex=True)
+    
+    # Remove tabs, then trim what the line cut/tab swap left behind
+    s = s.str.replace('\t', ' ', regex=False).str.strip()
+    
+    return s.mask(missing, "")
+
+def clean_numeric_like_batch(cells: Iterable[Optional[str]]) -> List[str]:
+    """
+    Apply clean_numeric_like to a sequence of cells (e.g. one table row).
+    
+    For whole DataFrame columns use clean_numeric_like_series instead.
+    
+    Args:
+        cells: Cell strings (None and non-strings become "")
+        
+    Returns:
+        List of cleaned strings, in the same order
+    """
+    return list(map(clean_numeric_like, cells))
+
+def clean_sheet_name(name: str, max_length: int = SHEET_NAME_MAX_LENGTH) -> str:
     """
     Create valid Excel sheet names.
     
@@ -97,7 +173,7 @@ def clean_sheet_name(name: str, max_length: int = 31) -> str:
         'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA'
     """
     # Remove invalid characters
-    name = re.sub(r"[\[\]\:\*\?\/\\]", "", name).strip()
+    name = _INVALID_SHEET_CHARS_RE.sub("", name).strip()
     
     # Truncate to max length
     name = name[:max_length]
@@ -106,6 +182,52 @@ def clean_sheet_name(name: str, max_length: int = 31) -> str:
     return name if name else "Sheet"
 
 
+def unique_sheet_name(
+    name: str,
+    used: Set[str],
+    max_length: int = SHEET_NAME_MAX_LENGTH,
+    suffixes: Sequence[str] = ()
+) -> str:
+    """
+    Make a valid sheet name unique within a workbook.
+    
+    Excel compares sheet names case-insensitively, and truncation to 31
+    characters can map different tables to the same name. Clashing names
+    get a "~2", "~3", ... suffix that still fits within max_length.
+    
+    Args:
+        name: Valid sheet name (see clean_sheet_name), at most max_length long
+        used: Lower-cased names already in the workbook; updated in place
+        max_length: Maximum length (default: 31 for Excel)
+        suffixes: Companion sheet suffixes (e.g. "_SUP"); name + suffix must
+                  be free as well, and is reserved in used with the name.
+                  Leave room for them in max_length.
+        
+    Returns:
+        Sheet name not yet in used
+        
+    Examples:
+        >>> used = set()
+        >>> unique_sheet_name("COBALT_0", used)
+        'COBALT_0'
+        >>> unique_sheet_name("cobalt_0", used)
+        'cobalt_0~2'
+        >>> unique_sheet_name("COBALT_0", used, 27, ("_SUP", "_SUB"))
+        'COBALT_0~3'
+        >>> sorted(used)
+        ['cobalt_0', 'cobalt_0~2', 'cobalt_0~3', 'cobalt_0~3_sub', 'cobalt_0~3_sup']
+    """
+    names = ("",) + tuple(suffixes)
+    candidate = name
+    n = 2
+    while any((candidate + s).lower() in used for s in names):
+        suffix = f"~{n}"
+        candidate = name[:max_length - len(suffix)] + suffix
+        n += 1
+    used.update((candidate + s).lower() for s in names)
+    return candidate
+
+
 def validate_file_path(path, must_exist: bool = True) -> bool:
     """
     Validate file path.
@@ -118,12 +240,14 @@ def validate_file_path(path, must_exist: bool = True) -> bool:
         True if valid, False otherwise
     """
     try:
-        path = Path(path)
-        
-        if must_exist:
-            return path.exists() and path.is_file()
-        else:
-            return True
-            
-    except (TypeError, ValueError):
-        return False
\ No newline at end of file
+        # fspath accepts str and Path alike without building a new Path
+        path = os.fspath(path)
+    except TypeError:
+        return False
+    
+    # bytes paths were never accepted (Path(bytes) raises TypeError)
+    if not isinstance(path, str):
+        return False
+    
+    # isfile is False for missing paths too: one stat() instead of two
+    return os.path.isfile(path) if must_exist else True
\ No newline at end of file